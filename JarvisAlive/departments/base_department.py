@@ -14,6 +14,13 @@ from enum import Enum
 
 import redis.asyncio as redis
 
+# orjson serializes state payloads in C (enums and dataclasses included);
+# fall back to stdlib json if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import existing agent infrastructure
 from agent_builder.agent_spec import AgentSpec
 from agent_builder.sandbox import SandboxManager
@@ -22,6 +29,13 @@ from orchestration.agent_communication import AgentMessageBus, MessageType
 logger = logging.getLogger(__name__)
 
 
+def _state_dumps(obj: Any) -> bytes:
+    """Serialize a state payload for Redis, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
 class WorkflowStatus(str, Enum):
     """Status of department workflows."""
     PENDING = "pending"
@@ -450,7 +464,7 @@ class Department(ABC):
             await self.redis_client.setex(
                 self.state_key,
                 86400,  # 24 hours TTL
-                json.dumps(state_data)
+                _state_dumps(state_data)
             )
             
             # Save workflows separately
@@ -461,7 +475,7 @@ class Department(ABC):
             await self.redis_client.setex(
                 self.workflows_key,
                 86400,
-                json.dumps(workflows_data)
+                _state_dumps(workflows_data)
             )
             
             # Save agents separately
@@ -472,7 +486,7 @@ class Department(ABC):
             await self.redis_client.setex(
                 self.agents_key,
                 86400,
-                json.dumps(agents_data)
+                _state_dumps(agents_data)
             )
             
             return True
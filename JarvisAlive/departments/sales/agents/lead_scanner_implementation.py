@@ -4,7 +4,7 @@ from pydantic import BaseModel, validator
 import logging
 import uuid
 import asyncio
-from collections import defaultdict
+from collections import Counter, defaultdict
 import re
 import json
 import sys
@@ -622,21 +622,12 @@ class LeadScannerAgent:
 
     def _get_top_industries(self, results: List[Lead]) -> Dict[str, int]:
         """Get top industries for monitoring"""
-        industry_count = defaultdict(int)
-        
-        for lead in results:
-            industry_count[lead.company.industry] += 1
-        
-        return dict(sorted(industry_count.items(), key=lambda x: x[1], reverse=True)[:5])
+        industry_count = Counter(lead.company.industry for lead in results)
+        return dict(industry_count.most_common(5))
 
     def _get_priority_distribution(self, results: List[Lead]) -> Dict[str, int]:
         """Get priority distribution for monitoring"""
-        priority_count = defaultdict(int)
-        
-        for lead in results:
-            priority_count[lead.outreach_priority] += 1
-        
-        return dict(priority_count)
+        return dict(Counter(lead.outreach_priority for lead in results))
 
     async def _enrich_with_ai(self, leads: List[Lead], max_enrichment: int = 10) -> List[Lead]:
         """